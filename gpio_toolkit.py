@@ -7,6 +7,7 @@
 # - Read / Write / Pulse
 # - Setup / Cleanup
 # - Numbering mode toggle (BCM/BOARD)
+# - sysfs fallback backend for status/monitor when RPi.GPIO is unavailable
 # - 40-pin mapping helper
 # - Profiles loader (JSON or YAML) to define named pin sets and defaults
 # - Curses TUI dashboard for live status
@@ -15,31 +16,54 @@
 #
 # Notes:
 # - YAML profiles require PyYAML; JSON works out-of-the-box.
+# - Parsed YAML profiles are cached under ~/.cache/gpio-toolkit (orjson optional).
 # - Run with sudo for full GPIO access on Raspberry Pi.
 
 import argparse
+import hashlib
 import os
 import sys
 import time
 import signal
 import json
-import csv
+import functools
+import mmap
+import queue
+import select
+import struct
+import threading
 from typing import List, Sequence, Optional, Dict, Any, Tuple
 
 try:
     import RPi.GPIO as GPIO
+    _GPIO_IMPORT_ERROR: Optional[Exception] = None
 except Exception as e:
-    print("ERROR: RPi.GPIO not available. Run on a Raspberry Pi or install the library.")
-    print(e)
-    sys.exit(1)
+    # Commands with a sysfs backend can still run; main() reports this otherwise.
+    GPIO = None
+    _GPIO_IMPORT_ERROR = e
 
 # Optional YAML support
 try:
     import yaml  # type: ignore
     _HAVE_YAML = True
+    try:
+        from yaml import CSafeLoader as _YamlLoader  # libyaml C extension
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader  # type: ignore
 except Exception:
     _HAVE_YAML = False
 
+# Optional fast JSON (profile cache)
+try:
+    import orjson  # type: ignore
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+
+PROFILE_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "gpio-toolkit"
+)
+
 # ======================= 40-pin header map (common) =========================
 PIN40_MAP = {
     1:  ("3V3", None),       2:  ("5V", None),
@@ -63,14 +87,153 @@ PIN40_MAP = {
     37: ("GPIO26", 26),      38: ("GPIO20", 20),
     39: ("GND", None),       40: ("GPIO21", 21),
 }
+# Same data as parallel tuples indexed by phys-1, for sequential scans.
+_PHYS_LABELS: Tuple[str, ...] = tuple(PIN40_MAP[i][0] for i in range(1, 41))
+_PHYS_BCM: Tuple[Optional[int], ...] = tuple(PIN40_MAP[i][1] for i in range(1, 41))
+_BCM_TO_PHYS = {b: i + 1 for i, b in enumerate(_PHYS_BCM) if b is not None}
+_BCM_GPIO_COUNT = 54
 
 def phys_from_bcm(bcm: int) -> Optional[int]:
-    for phys, (_, b) in PIN40_MAP.items():
-        if bcm == b:
-            return phys
-    return None
+    return _BCM_TO_PHYS.get(bcm)
+
+def bcm_for_pin(pin: int, mode: str) -> Optional[int]:
+    """Translate a pin number in the given numbering mode to its BCM GPIO number."""
+    if mode == "BCM":
+        return pin if 0 <= pin < _BCM_GPIO_COUNT else None
+    return _PHYS_BCM[pin - 1] if 1 <= pin <= 40 else None
+
+# ================= Direct register access (/dev/gpiomem) ====================
+# BCM283x/BCM2711 GPIO block layout. /dev/gpiomem also exists on the Pi 5, but
+# there it maps RP1 io_bank0 where these offsets are CTRL/STATUS registers, so
+# the mapping is only used after the SoC has been checked; otherwise callers
+# fall back to RPi.GPIO.
+GPIOMEM_PATH = "/dev/gpiomem"
+DT_COMPATIBLE_PATH = "/proc/device-tree/compatible"
+_BCM283X_COMPATIBLE = {b"brcm,bcm2835", b"brcm,bcm2836", b"brcm,bcm2837", b"brcm,bcm2711"}
+_GPIOMEM_SIZE = 4096
+_GPSET0 = 0x1C
+_GPCLR0 = 0x28
+_GPLEV0 = 0x34
+
+def soc_has_bcm283x_gpio() -> bool:
+    """True if the device tree names a SoC with the BCM283x GPIO register layout."""
+    try:
+        with open(DT_COMPATIBLE_PATH, "rb") as f:
+            compatible = f.read().split(b"\0")
+    except OSError:
+        return False
+    return any(c in _BCM283X_COMPATIBLE for c in compatible)
+
+def open_gpiomem(writable: bool = True) -> Optional[mmap.mmap]:
+    """Map the GPIO register block, or return None if unavailable or not BCM283x."""
+    if not soc_has_bcm283x_gpio():
+        return None
+    try:
+        fd = os.open(GPIOMEM_PATH, (os.O_RDWR if writable else os.O_RDONLY) | os.O_SYNC)
+    except OSError:
+        return None
+    try:
+        return mmap.mmap(fd, _GPIOMEM_SIZE,
+                         access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    finally:
+        os.close(fd)
+
+# ===================== sysfs GPIO (fallback backend) ========================
+SYSFS_GPIO_ROOT = "/sys/class/gpio"
+
+def sysfs_gpio_base() -> int:
+    """Return the sysfs number of BCM GPIO0 (non-zero on recent Pi kernels)."""
+    try:
+        chips = os.listdir(SYSFS_GPIO_ROOT)
+    except OSError:
+        return 0
+    for chip in chips:
+        if not chip.startswith("gpiochip"):
+            continue
+        try:
+            with open(f"{SYSFS_GPIO_ROOT}/{chip}/label", "r") as f:
+                label = f.read().strip()
+            if label.startswith(("pinctrl-bcm", "pinctrl-rp1")):
+                with open(f"{SYSFS_GPIO_ROOT}/{chip}/base", "r") as f:
+                    return int(f.read())
+        except (OSError, ValueError):
+            continue
+    return 0
+
+class _SysfsPin:
+    """A sysfs GPIO input whose value file stays open for seek+read polling."""
+
+    def __init__(self, bcm: int, base: int = 0):
+        self.num = base + bcm
+        self.path = f"{SYSFS_GPIO_ROOT}/gpio{self.num}"
+        self.exported = False
+        if not os.path.isdir(self.path):
+            with open(f"{SYSFS_GPIO_ROOT}/export", "w") as f:
+                f.write(str(self.num))
+            self.exported = True
+        try:
+            self.write_attr("direction", "in")
+            self.f = open(f"{self.path}/value", "rb", buffering=0)
+        except OSError:
+            if self.exported:
+                self._unexport()
+            raise
+
+    def write_attr(self, name: str, value: str):
+        # udev may need a moment to fix permissions on a freshly exported pin
+        for attempt in range(20):
+            try:
+                with open(f"{self.path}/{name}", "w") as f:
+                    f.write(value)
+                return
+            except PermissionError:
+                if attempt == 19:
+                    raise
+                time.sleep(0.05)
+
+    def read(self) -> int:
+        self.f.seek(0)
+        return self.f.read(1)[0] - 48
+
+    def _unexport(self):
+        try:
+            with open(f"{SYSFS_GPIO_ROOT}/unexport", "w") as f:
+                f.write(str(self.num))
+        except OSError:
+            pass
+
+    def close(self, unexport: bool = False):
+        self.f.close()
+        if unexport and self.exported:
+            self._unexport()
+
+def open_sysfs_pins(pins: Sequence[int], mode: str) -> List[Optional[_SysfsPin]]:
+    """Export and open each pin as a sysfs input; None where that is not possible."""
+    base = sysfs_gpio_base()
+    out: List[Optional[_SysfsPin]] = []
+    for p in pins:
+        bcm = bcm_for_pin(p, mode)
+        try:
+            out.append(_SysfsPin(bcm, base) if bcm is not None else None)
+        except OSError:
+            out.append(None)
+    return out
 
 # ============================== Utilities ===================================
+_CLEAR = "\x1b[2J\x1b[H"  # ANSI: clear screen, cursor home
+_SPIN_THRESHOLD = 0.001  # below this, time.sleep() overshoots too much
+
+def sleep_precise(seconds: float):
+    """Sleep, busy-spinning on the monotonic clock for sub-millisecond waits."""
+    if seconds >= _SPIN_THRESHOLD:
+        time.sleep(seconds)
+        return
+    deadline = time.monotonic_ns() + int(seconds * 1e9)
+    while time.monotonic_ns() < deadline:
+        pass
+
 def set_numbering(mode: str):
     mode = mode.upper()
     if mode not in ("BCM", "BOARD"):
@@ -81,12 +244,31 @@ def set_numbering(mode: str):
     else:
         GPIO.setmode(GPIO.BOARD)
 
-def parse_pins(pins: Sequence[str]) -> List[int]:
-    out: List[int] = []
-    for p in pins:
-        out.append(int(p))
+def setup_inputs_lenient(pins: Sequence[int], pud):
+    """Configure pins as inputs in one GPIO.setup() call.
+
+    RPi.GPIO rejects the whole list if any pin is invalid (e.g. a power pin in
+    BOARD mode), so fall back to per-pin setup and skip the ones that fail.
+    """
+    if not pins:
+        return
+    try:
+        GPIO.setup(list(pins), GPIO.IN, pull_up_down=pud)
+    except Exception:
+        for p in pins:
+            try:
+                GPIO.setup(p, GPIO.IN, pull_up_down=pud)
+            except Exception:
+                pass
+
+def parse_pins(pins: Sequence[Any]) -> List[int]:
+    out = [int(p) for p in pins]
+    bad = [n for n in out if not 0 <= n < 64]
+    if bad:
+        raise ValueError(f"invalid pin number(s): {', '.join(map(str, bad))}")
     return out
 
+@functools.lru_cache(maxsize=128)
 def pretty_label_for_pin(pin: int, mode: str) -> str:
     if mode == "BCM":
         phys = phys_from_bcm(pin)
@@ -100,10 +282,58 @@ def pretty_label_for_pin(pin: int, mode: str) -> str:
         suffix = f" [BCM {bcm}]" if bcm is not None else ""
         return f"{label} (phys {pin}){suffix}"
 
+def resolve_backend(backend: str) -> str:
+    if backend == "auto":
+        return "rpigpio" if GPIO is not None else "sysfs"
+    return backend
+
 def ensure_root():
     if os.geteuid() != 0:
         print("NOTE: Not running as root; some operations may fail (try sudo).", file=sys.stderr)
 
+def _json_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj) if _HAVE_ORJSON else json.dumps(obj).encode("utf-8")
+
+def _json_loads(raw: bytes) -> Any:
+    return orjson.loads(raw) if _HAVE_ORJSON else json.loads(raw)
+
+def _profile_cache_path(path: str) -> str:
+    # One entry per profile path; the source mtime/size are stored inside it,
+    # so an edit overwrites the old entry instead of adding another file.
+    key = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return os.path.join(PROFILE_CACHE_DIR, f"{key}.json")
+
+def _read_profile_cache(cache_path: str, st: os.stat_result) -> Optional[Dict[str, Any]]:
+    try:
+        with open(cache_path, "rb") as f:
+            entry = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict):
+        return None
+    if entry.get("mtime_ns") != st.st_mtime_ns or entry.get("size") != st.st_size:
+        return None
+    data = entry.get("data")
+    return data if isinstance(data, dict) else None
+
+def _write_profile_cache(cache_path: str, st: os.stat_result, data: Dict[str, Any]):
+    # Best effort: an unwritable cache dir or data JSON cannot represent
+    # exactly (non-string keys, dates, ...) just skips caching.
+    tmp = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        raw = _json_dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data})
+        if _json_loads(raw)["data"] != data:
+            return
+        os.makedirs(PROFILE_CACHE_DIR, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, cache_path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+
 def load_profile(path: Optional[str]) -> Dict[str, Any]:
     """
     Load a profile file (JSON or YAML) describing default mode and named pin sets.
@@ -116,20 +346,33 @@ def load_profile(path: Optional[str]) -> Dict[str, Any]:
         "spi": [10,9,11,8,7]
       }
     }
+
+    YAML profiles are parsed once per edit: the result is cached as JSON in
+    PROFILE_CACHE_DIR, one entry per path, valid while mtime and size match.
     """
     if not path:
         return {}
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Profile file not found: {path}")
+    is_yaml = _HAVE_YAML and (path.endswith(".yml") or path.endswith(".yaml"))
+    cache_path = None
+    if is_yaml:
+        st = os.stat(path)
+        cache_path = _profile_cache_path(path)
+        cached = _read_profile_cache(cache_path, st)
+        if cached is not None:
+            return cached
     with open(path, "r", encoding="utf-8") as f:
         data_str = f.read()
     data: Dict[str, Any]
-    if _HAVE_YAML and (path.endswith(".yml") or path.endswith(".yaml")):
-        data = yaml.safe_load(data_str) or {}
+    if is_yaml:
+        data = yaml.load(data_str, Loader=_YamlLoader) or {}
     else:
         data = json.loads(data_str)
     if not isinstance(data, dict):
         raise ValueError("Profile file must contain a JSON/YAML object")
+    if cache_path:
+        _write_profile_cache(cache_path, st, data)
     return data
 
 def resolve_pins_from_args_or_profile(args, profile: Dict[str, Any], mode: str) -> List[int]:
@@ -139,17 +382,16 @@ def resolve_pins_from_args_or_profile(args, profile: Dict[str, Any], mode: str)
         sets = profile.get("sets", {}) if profile else {}
         if args.set_name not in sets:
             raise SystemExit(f"Set '{args.set_name}' not found in profile.")
-        return list(map(int, sets[args.set_name]))
+        return parse_pins(sets[args.set_name])
     if profile and "default_pins" in profile:
-        return list(map(int, profile["default_pins"]))
+        return parse_pins(profile["default_pins"])
     return list(range(1, 41)) if mode == "BOARD" else [2,3,4,14,15,16,17,18,27,22,23,24,25,5,6,12,13,19,26,20,21]
 
 def cmd_map(args):
     print("\nRaspberry Pi 40-pin Header Map\n")
     print("Phys | Label              | BCM")
     print("-----+--------------------+-----")
-    for phys in range(1, 41):
-        label, bcm = PIN40_MAP.get(phys, ("(unknown)", None))
+    for phys, label, bcm in zip(range(1, 41), _PHYS_LABELS, _PHYS_BCM):
         bcm_str = str(bcm) if bcm is not None else "-"
         print(f"{phys:>4} | {label:<18} | {bcm_str:>3}")
     print("")
@@ -184,15 +426,14 @@ def cmd_status(args):
     profile = load_profile(args.profile) if args.profile else {}
     if not args.mode and profile.get("mode"):
         mode = str(profile["mode"]).upper()
-    set_numbering(mode)
+    backend = args.backend
+    if backend == "rpigpio":
+        set_numbering(mode)
 
     pins = resolve_pins_from_args_or_profile(args, profile, mode)
 
-    for p in pins:
-        try:
-            GPIO.setup(p, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-        except Exception:
-            pass
+    if backend == "rpigpio":
+        setup_inputs_lenient(pins, GPIO.PUD_DOWN)
 
     # compute column width based on longest label
     labels = [pretty_label_for_pin(p, mode) for p in pins]
@@ -200,30 +441,57 @@ def cmd_status(args):
     label_width = max(24, max_label_len + 2)  # pad a bit
     state_width = 10
 
-    def print_once():
-        os.system("clear" if os.name == "posix" else "cls")
-        header = f"📡 Current GPIO Status (mode: {mode})"
-        if args.profile:
-            header += f"  [profile: {os.path.basename(args.profile)}]"
-        if getattr(args, 'set_name', None):
-            header += f"  [set: {args.set_name}]"
-        print("\n" + header + "\n")
-
-        # top border
-        print("╔" + "═" * label_width + "╦" + "═" * state_width + "╗")
-        print(f"║ {'Pin':<{label_width-1}}║ {'State':<{state_width-1}}║")
-        print("╠" + "═" * label_width + "╬" + "═" * state_width + "╣")
-
-        for p, lbl in zip(pins, labels):
+    # Read GPLEV0/GPLEV1 once per refresh instead of one GPIO.input() per pin
+    # (BCM283x only; open_gpiomem() returns None elsewhere and GPIO.input() is used).
+    gpio_mem = open_gpiomem(writable=False) if backend == "rpigpio" else None
+    sysfs_pins = open_sysfs_pins(pins, mode) if backend == "sysfs" else []
+    bcms = [bcm_for_pin(p, mode) for p in pins]
+    bits: List[Optional[Tuple[bool, int]]] = [
+        (bcm >= 32, 1 << (bcm & 31)) if bcm is not None else None for bcm in bcms
+    ]
+
+    def read_states() -> List[Optional[int]]:
+        if gpio_mem is not None:
+            lev0, lev1 = struct.unpack_from("<II", gpio_mem, _GPLEV0)
+            return [None if b is None else ((lev1 if b[0] else lev0) & b[1])
+                    for b in bits]
+        if sysfs_pins:
+            return [sp.read() if sp is not None else None for sp in sysfs_pins]
+        states: List[Optional[int]] = []
+        for p in pins:
             try:
-                state = GPIO.input(p)
-                s = "HIGH (1)" if state else "LOW  (0)"
+                states.append(GPIO.input(p))
             except Exception:
-                s = "n/a"
-            print(f"║ {lbl:<{label_width-1}}║ {s:<{state_width-1}}║")
+                states.append(None)
+        return states
+
+    # Everything but the state column is invariant: build it once.
+    header = f"📡 Current GPIO Status (mode: {mode})"
+    if args.profile:
+        header += f"  [profile: {os.path.basename(args.profile)}]"
+    if getattr(args, 'set_name', None):
+        header += f"  [set: {args.set_name}]"
+    frame_head = (
+        _CLEAR + "\n" + header + "\n\n"
+        + "╔" + "═" * label_width + "╦" + "═" * state_width + "╗\n"
+        + f"║ {'Pin':<{label_width-1}}║ {'State':<{state_width-1}}║\n"
+        + "╠" + "═" * label_width + "╬" + "═" * state_width + "╣\n"
+    )
+    frame_tail = (
+        "╚" + "═" * label_width + "╩" + "═" * state_width + "╝\n"
+        + "\n🔄 Press CTRL+C to exit.\n\n"
+    )
+    row_prefixes = [f"║ {lbl:<{label_width-1}}║ " for lbl in labels]
+    cell_high, cell_low, cell_na = (f"{s:<{state_width-1}}║\n" for s in ("HIGH (1)", "LOW  (0)", "n/a"))
 
-        print("╚" + "═" * label_width + "╩" + "═" * state_width + "╝")
-        print("\n🔄 Press CTRL+C to exit.\n")
+    def print_once():
+        buf = [frame_head]
+        for prefix, state in zip(row_prefixes, read_states()):
+            buf.append(prefix)
+            buf.append(cell_na if state is None else (cell_high if state else cell_low))
+        buf.append(frame_tail)
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
 
     interval = args.interval
     count = args.count
@@ -238,85 +506,229 @@ def cmd_status(args):
     except KeyboardInterrupt:
         pass
     finally:
-        if args.cleanup:
+        if gpio_mem is not None:
+            gpio_mem.close()
+        for sp in sysfs_pins:
+            if sp is not None:
+                sp.close(unexport=args.cleanup)
+        if args.cleanup and backend == "rpigpio":
             GPIO.cleanup()
 
+# Log records are all integers, so they are formatted straight to bytes.
+# CSV keeps the \r\n line ending csv.writer used, so existing logs stay uniform.
+_CSV_HEADER = b"timestamp,pin,state\r\n"
+_CSV_TMPL = b"%d,%d,%d\r\n"
+_JSON_TMPL = b'{"timestamp":%d,"pin":%d,"state":%d}\n'
+
 def _open_loggers(csv_path: Optional[str], json_path: Optional[str]):
-    csv_writer = None
     csv_file = None
     json_file = None
     if csv_path:
-        csv_file = open(csv_path, "a", newline="", encoding="utf-8")
-        csv_writer = csv.writer(csv_file)
-        if os.stat(csv_path).st_size == 0:
-            csv_writer.writerow(["timestamp", "pin", "state"])
+        csv_file = open(csv_path, "ab")
+        if os.fstat(csv_file.fileno()).st_size == 0:
+            csv_file.write(_CSV_HEADER)
     if json_path:
-        json_file = open(json_path, "a", encoding="utf-8")
-    return csv_writer, csv_file, json_file
+        json_file = open(json_path, "ab")
+    return csv_file, json_file
 
-def _log_event(csv_writer, json_file, ts: float, pin: int, state: int):
-    if csv_writer:
-        csv_writer.writerow([int(ts), pin, int(state)])
+def _log_event(csv_file, json_file, ts: float, pin: int, state: int):
+    rec = (int(ts), pin, int(state))
+    if csv_file:
+        csv_file.write(_CSV_TMPL % rec)
     if json_file:
-        rec = {"timestamp": int(ts), "pin": pin, "state": int(state)}
-        json_file.write(json.dumps(rec) + "\n")
+        json_file.write(_JSON_TMPL % rec)
+
+_EVENT_QUEUE_SIZE = 4096  # edges buffered before the callback starts dropping
+_FLUSH_EVERY = 64         # events
+_FLUSH_INTERVAL = 0.1     # seconds idle before pending log lines are flushed
+_WRITER_STOP_TIMEOUT = 5.0  # seconds to wait for the writer to drain on exit
+
+def _flush_loggers(csv_file, json_file):
+    if csv_file:
+        csv_file.flush()
+    if json_file:
+        json_file.flush()
+
+def _event_writer(q: "queue.Queue", mode: str, csv_file, json_file, on_error):
+    """Drain (ts, pin, state) events from q until a None sentinel: print and log them.
+
+    An error while printing or logging (e.g. ENOSPC, EPIPE) ends the writer;
+    it is passed to on_error so the monitor can stop instead of piling up events.
+    """
+    try:
+        pending = 0
+        while True:
+            try:
+                item = q.get(timeout=_FLUSH_INTERVAL if pending else None)
+            except queue.Empty:
+                _flush_loggers(csv_file, json_file)
+                pending = 0
+                continue
+            if item is None:
+                break
+            ts, pin, state = item
+            label = pretty_label_for_pin(pin, mode)
+            print(f"[{time.strftime('%H:%M:%S', time.localtime(ts))}] {label} -> {'HIGH (1)' if state else 'LOW (0)'}")
+            _log_event(csv_file, json_file, ts, pin, state)
+            pending += 1
+            if pending >= _FLUSH_EVERY:
+                _flush_loggers(csv_file, json_file)
+                pending = 0
+        _flush_loggers(csv_file, json_file)
+    except Exception as e:
+        on_error(e)
+
+def _sysfs_edge_loop(sysfs_pins: Dict[int, _SysfsPin], edge: str, bouncetime: int, emit, stop_fd: int):
+    """Dispatch edges for all sysfs pins from one epoll loop until stop_fd is readable.
+
+    bouncetime (ms) is applied in software: an edge closer than that to the
+    previous accepted edge on the same pin is ignored.
+    """
+    bounce_ns = bouncetime * 1_000_000
+    ep = select.epoll()
+    try:
+        by_fd: Dict[int, Tuple[int, _SysfsPin]] = {}
+        for pin, sp in sysfs_pins.items():
+            sp.write_attr("edge", edge.lower())
+            sp.read()  # consume the initial value so only real edges wake us
+            ep.register(sp.f.fileno(), select.EPOLLPRI | select.EPOLLERR)
+            by_fd[sp.f.fileno()] = (pin, sp)
+        ep.register(stop_fd, select.EPOLLIN)
+        last_edge: Dict[int, int] = {}
+        while True:
+            for fd, _ in ep.poll():
+                if fd == stop_fd:
+                    return
+                pin, sp = by_fd[fd]
+                state = sp.read()
+                now = time.monotonic_ns()
+                prev = last_edge.get(fd)
+                if prev is not None and now - prev < bounce_ns:
+                    continue
+                last_edge[fd] = now
+                emit(pin, state)
+    finally:
+        ep.close()
 
 def cmd_monitor(args):
     mode = args.mode.upper()
     profile = load_profile(args.profile) if args.profile else {}
     if not args.mode and profile.get("mode"):
         mode = str(profile["mode"]).upper()
-    set_numbering(mode)
+    backend = args.backend
+    if backend == "rpigpio":
+        set_numbering(mode)
 
     pins = resolve_pins_from_args_or_profile(args, profile, mode)
-    edge_map = {"RISING": GPIO.RISING, "FALLING": GPIO.FALLING, "BOTH": GPIO.BOTH}
-    edge = edge_map[args.edge.upper()]
 
     pull = (args.pull.upper() if args.pull else "DOWN")
-    pud = GPIO.PUD_DOWN if pull == "DOWN" else (GPIO.PUD_UP if pull == "UP" else GPIO.PUD_OFF)
-    for p in pins:
-        GPIO.setup(p, GPIO.IN, pull_up_down=pud)
+    if backend == "rpigpio":
+        edge_map = {"RISING": GPIO.RISING, "FALLING": GPIO.FALLING, "BOTH": GPIO.BOTH}
+        edge = edge_map[args.edge.upper()]
+        pud = GPIO.PUD_DOWN if pull == "DOWN" else (GPIO.PUD_UP if pull == "UP" else GPIO.PUD_OFF)
+        GPIO.setup(list(pins), GPIO.IN, pull_up_down=pud)
+    else:
+        pull = "unchanged (sysfs)"
 
     bouncetime = args.bounce
 
-    csv_writer, csv_file, json_file = _open_loggers(args.log_csv, args.log_json)
+    csv_file, json_file = _open_loggers(args.log_csv, args.log_json)
     print(f"🔍 Monitoring pins {pins} (mode {mode}, edge {args.edge}, pull {pull}, debounce {bouncetime}ms). CTRL+C to stop.")
     if args.log_csv:
         print(f"   → logging CSV to {args.log_csv}")
     if args.log_json:
         print(f"   → logging JSONL to {args.log_json}")
 
-    def cb(channel):
-        state = GPIO.input(channel)
-        label = pretty_label_for_pin(channel, mode)
-        ts = time.time()
-        print(f"[{time.strftime('%H:%M:%S')}] {label} -> {'HIGH (1)' if state else 'LOW (0)'}")
-        _log_event(csv_writer, json_file, ts, channel, state)
+    # Block the main thread until SIGINT/SIGTERM instead of waking every second.
+    # The pipe wakes the sysfs epoll loop the same way.
+    stop = threading.Event()
+    wake_r, wake_w = os.pipe()
 
-    for p in pins:
+    def on_stop(*_):
+        stop.set()
         try:
-            GPIO.remove_event_detect(p)
-        except Exception:
+            os.write(wake_w, b"\0")
+        except OSError:
             pass
-        GPIO.add_event_detect(p, edge, callback=cb, bouncetime=bouncetime)
 
+    signal.signal(signal.SIGINT, on_stop)
+    signal.signal(signal.SIGTERM, on_stop)
+
+    # Printing and logging happen on a writer thread so the GPIO event
+    # thread only pays for an enqueue. If the writer fails, stop monitoring.
+    events: "queue.Queue" = queue.Queue(maxsize=_EVENT_QUEUE_SIZE)
+    dropped = 0
+    writer_error: List[Exception] = []
+
+    def on_writer_error(e: Exception):
+        writer_error.append(e)
+        on_stop()
+
+    writer = threading.Thread(target=_event_writer, args=(events, mode, csv_file, json_file, on_writer_error), daemon=True)
+    writer.start()
+
+    def enqueue(channel: int, state: int):
+        nonlocal dropped
+        try:
+            events.put_nowait((time.time(), channel, state))
+        except queue.Full:
+            dropped += 1
+
+    def cb(channel):
+        enqueue(channel, GPIO.input(channel))
+
+    sysfs_pins: Dict[int, _SysfsPin] = {}
     try:
-        while True:
-            time.sleep(1)
+        if backend == "sysfs":
+            base = sysfs_gpio_base()
+            for p in pins:
+                bcm = bcm_for_pin(p, mode)
+                if bcm is None:
+                    raise ValueError(f"{pretty_label_for_pin(p, mode)} is not a GPIO")
+                sysfs_pins[p] = _SysfsPin(bcm, base)
+            _sysfs_edge_loop(sysfs_pins, args.edge, bouncetime, enqueue, wake_r)
+        else:
+            for p in pins:
+                try:
+                    GPIO.remove_event_detect(p)
+                except Exception:
+                    pass
+                GPIO.add_event_detect(p, edge, callback=cb, bouncetime=bouncetime)
+
+            stop.wait()
     except KeyboardInterrupt:
         pass
     finally:
-        for p in pins:
+        if backend == "sysfs":
+            for sp in sysfs_pins.values():
+                sp.close(unexport=args.cleanup)
+        else:
+            for p in pins:
+                try:
+                    GPIO.remove_event_detect(p)
+                except Exception:
+                    pass
+        # A dead writer no longer drains the queue, so never block on the sentinel.
+        if writer.is_alive():
             try:
-                GPIO.remove_event_detect(p)
-            except Exception:
+                events.put(None, timeout=_WRITER_STOP_TIMEOUT)
+            except queue.Full:
                 pass
-        if csv_file:
-            csv_file.close()
-        if json_file:
-            json_file.close()
-        if args.cleanup:
+            writer.join(_WRITER_STOP_TIMEOUT)
+        os.close(wake_r)
+        os.close(wake_w)
+        if dropped:
+            print(f"WARNING: dropped {dropped} events (logger could not keep up)", file=sys.stderr)
+        for log_file in (csv_file, json_file):
+            if log_file:
+                try:
+                    log_file.close()
+                except OSError as e:
+                    writer_error.append(e)
+        if args.cleanup and backend == "rpigpio":
             GPIO.cleanup()
+    if writer_error:
+        raise RuntimeError(f"event logging stopped: {writer_error[0]}")
 
 def cmd_read(args):
     mode = args.mode.upper()
@@ -349,15 +761,44 @@ def cmd_pulse(args):
     repeat = args.repeat
     gap = args.gap
     GPIO.setup(pin, GPIO.OUT)
+
+    # Drive edges with single GPSETn/GPCLRn stores when the registers are mapped.
+    gpio_mem = None
+    regs = None
+    bcm = bcm_for_pin(pin, mode)
+    if bcm is not None:
+        gpio_mem = open_gpiomem()
+    if gpio_mem is not None:
+        regs = memoryview(gpio_mem).cast("I")
+        set_idx = (_GPSET0 >> 2) + (bcm >> 5)
+        clr_idx = (_GPCLR0 >> 2) + (bcm >> 5)
+        mask = 1 << (bcm & 31)
+
+        def high():
+            regs[set_idx] = mask
+
+        def low():
+            regs[clr_idx] = mask
+    else:
+        def high():
+            GPIO.output(pin, GPIO.HIGH)
+
+        def low():
+            GPIO.output(pin, GPIO.LOW)
+
     print(f"Pulsing {pretty_label_for_pin(pin, mode)}: width={width}s repeat={repeat} gap={gap}s")
     try:
         for i in range(repeat):
-            GPIO.output(pin, GPIO.HIGH)
-            time.sleep(width)
-            GPIO.output(pin, GPIO.LOW)
+            high()
+            sleep_precise(width)
+            low()
             if i < repeat - 1:
-                time.sleep(gap)
+                sleep_precise(gap)
     finally:
+        if regs is not None:
+            regs.release()
+        if gpio_mem is not None:
+            gpio_mem.close()
         if args.cleanup:
             GPIO.cleanup()
 
@@ -374,52 +815,51 @@ def cmd_tui(args):
 
     pins = resolve_pins_from_args_or_profile(args, profile, mode)
 
-    for p in pins:
-        try:
-            GPIO.setup(p, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
-        except Exception:
-            pass
+    setup_inputs_lenient(pins, GPIO.PUD_DOWN)
 
     interval = max(0.1, args.interval)
 
+    # labels are invariant; build each row's "<label> " prefix once
+    labels = [pretty_label_for_pin(p, mode) for p in pins]
+    prefixes = [f"{label:<22} " for label in labels]
+
     import curses
 
     def draw(stdscr):
         curses.curs_set(0)
-        stdscr.nodelay(True)
-        last = 0.0
+        # getch() blocks for up to one interval, so the loop only wakes to
+        # redraw or to handle a key
+        stdscr.timeout(int(interval * 1000))
+        # state word last drawn per pin; empty means the screen needs a full repaint
+        prev_states: Dict[int, str] = {}
         while True:
-            now = time.time()
-            if now - last >= interval:
+            if not prev_states:
                 stdscr.erase()
                 title = f"GPIO TUI (mode: {mode})  profile: {os.path.basename(args.profile) if args.profile else '-'}  set: {getattr(args,'set_name',None) or '-'}"
                 stdscr.addstr(0, 0, title)
                 stdscr.addstr(1, 0, "Press 'q' to quit, 'r' to refresh")
                 stdscr.addstr(3, 0, f"{'Pin':<22} State")
-                row = 4
-                for p in pins:
-                    label = pretty_label_for_pin(p, mode)
-                    try:
-                        s = GPIO.input(p)
-                        state = "HIGH" if s else "LOW "
-                    except Exception:
-                        state = "n/a "
-                    stdscr.addstr(row, 0, f"{label:<22} {state}")
-                    row += 1
-                stdscr.refresh()
-                last = now
-
-            try:
-                ch = stdscr.getch()
-            except curses.error:
-                ch = -1
-
+            row = 4
+            for p, prefix in zip(pins, prefixes):
+                try:
+                    s = GPIO.input(p)
+                    state = "HIGH" if s else "LOW "
+                except Exception:
+                    state = "n/a "
+                # only rows whose state changed are rewritten
+                if prev_states.get(row) != state:
+                    stdscr.addstr(row, 0, prefix + state)
+                    prev_states[row] = state
+                row += 1
+            stdscr.noutrefresh()
+            curses.doupdate()
+
+            ch = stdscr.getch()
             if ch == ord('q'):
                 break
             elif ch == ord('r'):
-                last = 0
-
-            time.sleep(0.02)
+                prev_states.clear()
+                stdscr.clear()
 
     try:
         curses.wrapper(draw)
@@ -427,19 +867,20 @@ def cmd_tui(args):
         if args.cleanup:
             GPIO.cleanup()
 
-def build_parser() -> argparse.ArgumentParser:
+def build_common() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         description="GPIO Toolkit for Raspberry Pi (RPi.GPIO)",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
     )
     p.add_argument("--mode", default="BCM", help="Numbering mode: BCM or BOARD")
     p.add_argument("--profile", help="JSON or YAML profile file defining default pins and named sets")
+    return p
 
-    sub = p.add_subparsers(dest="cmd", required=True)
-
+def _add_map_parser(sub):
     sp = sub.add_parser("map", help="Print 40-pin header mapping table")
     sp.set_defaults(func=cmd_map)
 
+def _add_setup_parser(sub):
     sp = sub.add_parser("setup", help="Configure a pin as IN/OUT with optional pull/initial")
     sp.add_argument("--pin", type=int, required=True)
     sp.add_argument("--direction", required=True, choices=["IN","OUT"])
@@ -447,14 +888,18 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--initial", help="Initial value for OUT: HIGH/LOW/1/0/ON/OFF/TRUE/FALSE")
     sp.set_defaults(func=cmd_setup)
 
+def _add_status_parser(sub):
     sp = sub.add_parser("status", help="Live table of pin states")
     sp.add_argument("--pins", nargs="+", help="Pins to read (default from profile or sensible set)")
     sp.add_argument("--set-name", help="Use a named set from profile (e.g., 'garage')")
     sp.add_argument("--interval", type=float, default=1.0, help="Refresh interval seconds")
     sp.add_argument("--count", type=int, help="Number of refreshes before exit (default: infinite)")
-    sp.add_argument("--cleanup", action="store_true", help="Call GPIO.cleanup() on exit")
+    sp.add_argument("--backend", choices=["auto","rpigpio","sysfs"], default="auto",
+                    help="GPIO access: RPi.GPIO, or /sys/class/gpio (auto: sysfs if RPi.GPIO is missing)")
+    sp.add_argument("--cleanup", action="store_true", help="Call GPIO.cleanup() (sysfs: unexport) on exit")
     sp.set_defaults(func=cmd_status)
 
+def _add_monitor_parser(sub):
     sp = sub.add_parser("monitor", help="Attach edge callbacks and print/log changes")
     sp.add_argument("--pins", nargs="+", help="Pins to monitor (or use --set-name / profile defaults)")
     sp.add_argument("--set-name", help="Use a named set from profile (e.g., 'garage')")
@@ -463,21 +908,26 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--bounce", type=int, default=200, help="Debounce bouncetime (ms)")
     sp.add_argument("--log-csv", help="Append CSV log (timestamp,pin,state)")
     sp.add_argument("--log-json", help="Append JSONL log (one JSON record per line)")
-    sp.add_argument("--cleanup", action="store_true", help="Call GPIO.cleanup() on exit")
+    sp.add_argument("--backend", choices=["auto","rpigpio","sysfs"], default="auto",
+                    help="Edge source: RPi.GPIO callbacks, or one epoll loop on /sys/class/gpio (--pull is not applied)")
+    sp.add_argument("--cleanup", action="store_true", help="Call GPIO.cleanup() (sysfs: unexport) on exit")
     sp.set_defaults(func=cmd_monitor)
 
+def _add_read_parser(sub):
     sp = sub.add_parser("read", help="Read a single pin (as input)")
     sp.add_argument("--pin", type=int, required=True)
     sp.add_argument("--pull", choices=["UP","DOWN","OFF"], default="OFF")
     sp.add_argument("--cleanup", action="store_true")
     sp.set_defaults(func=cmd_read)
 
+def _add_write_parser(sub):
     sp = sub.add_parser("write", help="Write a single pin (as output)")
     sp.add_argument("--pin", type=int, required=True)
     sp.add_argument("--value", required=True, choices=["HIGH","LOW","1","0","ON","OFF","TRUE","FALSE"])
     sp.add_argument("--cleanup", action="store_true")
     sp.set_defaults(func=cmd_write)
 
+def _add_pulse_parser(sub):
     sp = sub.add_parser("pulse", help="Pulse a pin HIGH for a duration (repeatable)")
     sp.add_argument("--pin", type=int, required=True)
     sp.add_argument("--width", type=float, default=0.5, help="Pulse width seconds")
@@ -486,9 +936,11 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--cleanup", action="store_true")
     sp.set_defaults(func=cmd_pulse)
 
+def _add_cleanup_parser(sub):
     sp = sub.add_parser("cleanup", help="GPIO.cleanup()")
     sp.set_defaults(func=cmd_cleanup)
 
+def _add_tui_parser(sub):
     sp = sub.add_parser("tui", help="Curses TUI dashboard for live status")
     sp.add_argument("--pins", nargs="+", help="Pins to display (or use --set-name / profile defaults)")
     sp.add_argument("--set-name", help="Use a named set from profile (e.g., 'garage')")
@@ -496,13 +948,59 @@ def build_parser() -> argparse.ArgumentParser:
     sp.add_argument("--cleanup", action="store_true", help="Call GPIO.cleanup() on exit")
     sp.set_defaults(func=cmd_tui)
 
+_SUBCOMMANDS = {
+    "map": _add_map_parser,
+    "setup": _add_setup_parser,
+    "status": _add_status_parser,
+    "monitor": _add_monitor_parser,
+    "read": _add_read_parser,
+    "write": _add_write_parser,
+    "pulse": _add_pulse_parser,
+    "cleanup": _add_cleanup_parser,
+    "tui": _add_tui_parser,
+}
+_GLOBAL_VALUE_OPTS = ("--mode", "--profile")
+
+def build_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser; with `only`, add just that subcommand's parser."""
+    p = build_common()
+    sub = p.add_subparsers(dest="cmd", required=True)
+    for name, add_parser in _SUBCOMMANDS.items():
+        if only is None or name == only:
+            add_parser(sub)
     return p
 
+def _peek_command(argv: Sequence[str]) -> Optional[str]:
+    """Find the subcommand in argv without parsing it.
+
+    Returns None for top-level help or anything unrecognised, so the caller
+    builds the full parser and argparse produces its usual help or error.
+    """
+    it = iter(argv)
+    for tok in it:
+        if tok in ("-h", "--help"):
+            return None
+        if tok.startswith("-"):
+            # skip the value of --mode/--profile (argparse also accepts prefixes)
+            if len(tok) > 2 and "=" not in tok and any(o.startswith(tok) for o in _GLOBAL_VALUE_OPTS):
+                next(it, None)
+            continue
+        return tok if tok in _SUBCOMMANDS else None
+    return None
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     ensure_root()
-    parser = build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = build_parser(_peek_command(argv))
     args = parser.parse_args(argv)
 
+    args.backend = resolve_backend(getattr(args, "backend", "rpigpio"))
+    if args.backend == "rpigpio" and GPIO is None:
+        print("ERROR: RPi.GPIO not available. Run on a Raspberry Pi or install the library.")
+        print(_GPIO_IMPORT_ERROR)
+        return 1
+
     signal.signal(signal.SIGINT, lambda *_: sys.exit(0))
     signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
 